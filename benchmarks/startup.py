@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for j2tmpl.
+
+Renders a trivial template with ``python -m j2tmpl`` and,
+if it has been built, the frozen binary, several times
+each. Since the template is trivial, the time taken is
+almost entirely startup. The median run time of each is
+compared against a threshold and this exits with a non-zero
+status if any are over it.
+
+.. code-block:: shell
+
+    $ python benchmarks/startup.py
+    $ python benchmarks/startup.py --binary dist/j2tmpl --max-binary-ms 400
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def time_command(command, env, runs):
+    """
+    Run `command` `runs` times, returning the time each run
+    took in milliseconds.
+    """
+    # Warm up the filesystem cache so the first run doesn't
+    # skew the results.
+    subprocess.run(command, env=env, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def main(argv):
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20,
+                        help="Number of times to run each command.")
+    parser.add_argument("--binary", default=os.path.join(ROOT, "dist", "j2tmpl"),
+                        help="Path to the frozen binary. Skipped if it does not exist.")
+    parser.add_argument("--max-module-ms", type=float, default=250,
+                        help="Maximum median startup time of `python -m j2tmpl`.")
+    parser.add_argument("--max-binary-ms", type=float, default=500,
+                        help="Maximum median startup time of the frozen binary.")
+    args = parser.parse_args(argv)
+
+    with TemporaryDirectory() as tmpdir:
+        template = os.path.join(tmpdir, "startup.jinja")
+        with open(template, 'w') as f:
+            f.write("{{ benchmark.value }}\n")
+
+        # A minimal environment keeps the context build out of
+        # the measurement.
+        env = {'PATH': os.environ.get('PATH', ''), 'BENCHMARK_VALUE': 'startup'}
+        if 'PYTHONPATH' in os.environ:
+            env['PYTHONPATH'] = os.environ['PYTHONPATH']
+
+        commands = [("python -m j2tmpl", [sys.executable, "-m", "j2tmpl", template], args.max_module_ms)]
+        if os.path.isfile(args.binary):
+            commands.append(("frozen binary", [args.binary, template], args.max_binary_ms))
+        else:
+            print("Skipping frozen binary, %s does not exist" % (args.binary))
+
+        failed = False
+        for name, command, threshold in commands:
+            timings = time_command(command, env, args.runs)
+            median = statistics.median(timings)
+
+            print("%s: median %.1fms, min %.1fms, max %.1fms (threshold %.1fms)" % (
+                name, median, min(timings), max(timings), threshold))
+
+            if median > threshold:
+                print("%s startup regressed: %.1fms > %.1fms" % (name, median, threshold), file=sys.stderr)
+                failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
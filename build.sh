@@ -7,3 +7,4 @@ mkdir -p dist &>/dev/null
 pytest
 python3 -m build . --sdist --wheel
 python3 -OO -m PyInstaller -F j2tmpl/cli.py -n j2tmpl
+python3 benchmarks/startup.py --binary dist/j2tmpl
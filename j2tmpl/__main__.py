@@ -0,0 +1,3 @@
+from j2tmpl import entrypoint
+
+entrypoint()
@@ -43,26 +43,34 @@ Would result in:
 """
 from __future__ import print_function
 
+# Jinja and anything only some commands need are imported where
+# they are first used. Startup time matters for a tool that is
+# typically run once per container start, particularly as a
+# frozen binary.
 import os
 import sys
-import re
 import base64
 
-from jinja2 import Environment, Undefined, FileSystemLoader
-from jinja2.exceptions import TemplateSyntaxError
-from argparse import ArgumentParser
 
-
-class PermissiveUndefined(Undefined):
+def create_permissive_undefined():
     """
-    A more permissive undefined that also also allows
-    __getattr__. This allows `default` to work across
-    the entire complex object.
+    Create the undefined type used by the environment. This
+    is deferred along with the Jinja import.
     """
-    def __getattr__(self, name):
-        if name[:2] == '__':
-            raise AttributeError(name)  # pragma: no cover (note sure how to test this)
-        return self
+    from jinja2 import Undefined
+
+    class PermissiveUndefined(Undefined):
+        """
+        A more permissive undefined that also also allows
+        __getattr__. This allows `default` to work across
+        the entire complex object.
+        """
+        def __getattr__(self, name):
+            if name[:2] == '__':
+                raise AttributeError(name)  # pragma: no cover (note sure how to test this)
+            return self
+
+    return PermissiveUndefined
 
 
 # TODO: Find a way to test the Undefined verification below.
@@ -72,6 +80,10 @@ def read_file_filter(filename):
     Jinja filter that reads the contents of a file into the template
     given the filename.
     """
+    # Once Jinja is loaded, as it is whenever a filter runs
+    # in a template, this is only a lookup.
+    from jinja2 import Undefined
+
     if isinstance(filename, Undefined):
         return filename
 
@@ -88,6 +100,8 @@ def boolean_filter(value):
 
     Note that this is case insensitive.
     """
+    from jinja2 import Undefined
+
     if isinstance(value, Undefined):
         return value
 
@@ -98,6 +112,8 @@ def b64encode_filter(value):
     """
     Jinja filter that base64 encodes the given value.
     """
+    from jinja2 import Undefined
+
     if isinstance(value, Undefined):
         return value
 
@@ -108,24 +124,54 @@ def b64decode_filter(value):
     """
     Jinja filter that base64 decodes the given value.
     """
+    from jinja2 import Undefined
+
     if isinstance(value, Undefined):
         return value
 
     return base64.b64decode(value.encode('utf-8')).decode('utf-8')
 
 
-ENVIRONMENT = Environment(
-                 trim_blocks=True,
-                 lstrip_blocks=True,
-                 keep_trailing_newline=True,
-                 undefined=PermissiveUndefined,
-                 extensions=['jinja2.ext.do', 'jinja2.ext.loopcontrols']
-)
+_ENVIRONMENT = None
+
 
-ENVIRONMENT.filters['readfile'] = read_file_filter
-ENVIRONMENT.filters['boolean'] = boolean_filter
-ENVIRONMENT.filters['b64encode'] = b64encode_filter
-ENVIRONMENT.filters['b64decode'] = b64decode_filter
+def get_environment():
+    """
+    Return the Jinja environment shared by every template,
+    creating it on first use.
+    """
+    global _ENVIRONMENT
+
+    if _ENVIRONMENT is None:
+        from jinja2 import Environment
+
+        environment = Environment(
+                         trim_blocks=True,
+                         lstrip_blocks=True,
+                         keep_trailing_newline=True,
+                         undefined=create_permissive_undefined(),
+                         extensions=['jinja2.ext.do', 'jinja2.ext.loopcontrols']
+        )
+
+        environment.filters['readfile'] = read_file_filter
+        environment.filters['boolean'] = boolean_filter
+        environment.filters['b64encode'] = b64encode_filter
+        environment.filters['b64decode'] = b64decode_filter
+
+        _ENVIRONMENT = environment
+
+    return _ENVIRONMENT
+
+
+def __getattr__(name):
+    # These used to be created on import. Keep them available
+    # without doing so.
+    if name == 'ENVIRONMENT':
+        return get_environment()
+    if name == 'PermissiveUndefined':
+        return get_environment().undefined
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def build_template_context(raw_context):
@@ -139,6 +185,8 @@ def build_template_context(raw_context):
     underscores and casing, then constructing a tree along
     those splits.
     """
+    import re
+
     context = {}
 
     for k, v in raw_context.items():
@@ -176,112 +224,426 @@ def build_template_context(raw_context):
     return context
 
 
-def render_file(template, context, output=None, append=False, verbose=False):
+# Bump this whenever the way contexts are built changes, so
+# snapshots written by an older version are rebuilt.
+CONTEXT_SNAPSHOT_MAGIC = b'J2TMPLCTX2'
+
+
+def snapshot_key(raw_context):
+    """
+    Serialize a flat `raw_context` independently of the order
+    of its keys, to identify the context built from it.
+    """
+    import marshal
+
+    return marshal.dumps(sorted(raw_context.items()))
+
+
+def load_template_context(raw_context, snapshot=None):
+    """
+    Build a template context from a given `raw_context`, reusing
+    the one stored in the `snapshot` file if possible.
+
+    The snapshot stores the `raw_context` it was built from.
+    If that matches exactly, the stored context is returned as
+    is. Otherwise, the context is rebuilt and the snapshot is
+    rewritten, if possible.
+    """
+    if snapshot is None:
+        return build_template_context(raw_context)
+
+    import marshal
+
+    # Comparing the serialized environment outright is both
+    # exact and cheaper than hashing it.
+    key = snapshot_key(raw_context)
+    header = CONTEXT_SNAPSHOT_MAGIC + len(key).to_bytes(4, 'big') + key
+
+    try:
+        with open(snapshot, 'rb') as f:
+            data = f.read()
+
+        if data.startswith(header):
+            return marshal.loads(memoryview(data)[len(header):])
+    except (OSError, EOFError, ValueError, TypeError):
+        # A missing or corrupt snapshot is simply rebuilt.
+        pass
+
+    context = build_template_context(raw_context)
+
+    # Write to a temporary file first so that a concurrent run
+    # never sees a partially written snapshot. It contains the
+    # whole environment, so only the owner may read it.
+    temporary = "%s.%d.tmp" % (snapshot, os.getpid())
+    try:
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except OSError:
+        # The snapshot is only a cache, failing to write it
+        # must not stop the render.
+        return context
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            marshal.dump(context, f)
+        os.replace(temporary, snapshot)
+    except OSError:
+        os.unlink(temporary)
+
+    return context
+
+
+def format_syntax_error(template, e, action="rendering"):
+    """
+    Format a `TemplateSyntaxError` raised by `template` while
+    `action` was performed, along with the offending line and
+    the lines surrounding it.
+    """
+    source = e.source.splitlines()
+    columns = str(len(str(e.lineno + 1)))
+    index = e.lineno - 1
+
+    lines = ["Error %s %s: %s" % (action, template, e.message)]
+
+    if index > 0:
+        lines.append(("%" + columns + "d:    %s") % (e.lineno - 1, source[index - 1]))
+    lines.append(("%" + columns + "d: >> %s") % (e.lineno, source[index]))
+    if index < len(source)-1:
+        lines.append(("%" + columns + "d:    %s") % (e.lineno + 1, source[index + 1]))
+
+    return "\n".join(lines)
+
+
+def compression_opener(extension):
+    """
+    Return the function that opens files compressed with the
+    format matching `extension`, or `None` if it isn't supported.
+    """
+    if extension == 'gz':
+        import gzip
+
+        return gzip.open
+    elif extension == 'zst':
+        try:
+            from compression import zstd
+        except ImportError:  # pragma: no cover (zstd is only in the standard library from 3.14)
+            return None
+
+        return zstd.open
+
+    return None
+
+
+def open_compressed(output, extension, mode):
+    """
+    Open the sibling of `output` compressed with the format
+    matching `extension` for writing text.
+    """
+    opener = compression_opener(extension)
+    if opener is None:
+        raise ValueError("%s compression is not supported" % (extension))
+
+    return opener("%s.%s" % (output, extension), mode + 't')
+
+
+def render_file(template, context, output=None, append=False, verbose=False, compress=(), compressed=()):
+    from contextlib import ExitStack
+    from jinja2.exceptions import TemplateSyntaxError
+
     if verbose:  # pragma: no cover
         if output is None or template == output:
             print("Rendering", template)
         else:
             print("Rendering", template, "to", output)
 
-    with open(template) as f:
-        output = open(output, 'a' if append else 'w') \
-            if output else sys.stdout
+    with open(template) as f, ExitStack() as stack:
+        # Compressed siblings are written from the same stream
+        # as the output itself so they never have to be read
+        # back. Those in `compressed` are already open, which
+        # lets several templates share one member or frame.
+        if output:
+            mode = 'a' if append else 'w'
+            outputs = [stack.enter_context(open(output, mode))] + \
+                [stack.enter_context(open_compressed(output, extension, mode)) for extension in compress] + \
+                list(compressed)
+        else:
+            outputs = [sys.stdout]
 
         try:
-            ENVIRONMENT.from_string(f.read()).stream(context).dump(output)
+            for chunk in get_environment().from_string(f.read()).stream(context):
+                for o in outputs:
+                    o.write(chunk)
         except TemplateSyntaxError as e:
-            source = e.source.splitlines()
-            columns = str(len(str(e.lineno + 1)))
-            index = e.lineno - 1
-
-            print("Error rendering %s: %s" % (template, e.message), file=sys.stderr)
-
-            if index > 0:
-                print(("%" + columns + "d:    %s") % (e.lineno - 1, source[index - 1]), file=sys.stderr)
-            print(("%" + columns + "d: >> %s") % (e.lineno, source[index]), file=sys.stderr)
-            if index < len(source)-1:
-                print(("%" + columns + "d:    %s") % (e.lineno + 1, source[index + 1]), file=sys.stderr)
+            print(format_syntax_error(template, e), file=sys.stderr)
 
             raise e
 
-    if output and output != sys.stdout:
-        output.close()
 
-
-def render(path, output, context, args):
+def walk_templates(path, output, args):
     """
-    Render a template based on the arguments and
-    the given `raw_context`, which, by default
-    is the OS environment.
+    Find the templates to render for `path`, which may be
+    a single template or a directory of templates.
+
+    Yields a list of templates along with the file they should
+    be rendered to. All templates in a list are concatenated
+    into that one file, in order. An empty list means the
+    target file should be removed.
+
+    Output directories are created as they are walked.
     """
     # Make sure we have the full real path for later
     # comparisons.
     path = os.path.realpath(path)
     output_path = os.path.realpath(output) if output is not None else None
 
+    if not os.path.isdir(path):
+        yield [path], output_path
+        return
+
+    if output_path is not None:
+        if not os.path.exists(output_path):
+            os.makedirs(output_path)
+        elif not os.path.isdir(output_path):
+            raise OSError("%s already exists and is not a directory" % (output_path))
+
+    # So we could use os.walk here but we need to control
+    # what we do with directories based on the name so
+    # it's actually easier not to.
+    for entry in os.listdir(path):
+        # Figure out the paths to the current file, the target
+        # file, and the file extension of the current file.
+        entry_path = os.path.realpath(os.path.join(path, entry))
+        entry_name, extension = os.path.splitext(os.path.basename(entry))
+
+        if output_path is not None:
+            target_entry_path = os.path.realpath(os.path.join(output_path, entry_name))
+        else:
+            target_entry_path = None
+
+        # For directories, we either have to descend into them, or
+        # we need to process them as fragments, depending on their
+        # name.
+        if os.path.isdir(entry_path):
+            if extension == '.d' and \
+               os.path.splitext(entry_name)[1] in args.template_extensions:
+                if target_entry_path is None:
+                    fragment_target_path = None
+                else:
+                    fragment_target_path = os.path.splitext(target_entry_path)[0]
+
+                templates = []
+
+                fragment_base_template = os.path.splitext(entry_path)[0]
+                if os.path.isfile(fragment_base_template):
+                    templates.append(fragment_base_template)
+
+                for fragment in sorted(os.listdir(entry_path)):
+                    if os.path.splitext(fragment)[1] in args.template_extensions:
+                        templates.append(os.path.join(entry_path, fragment))
+
+                yield templates, fragment_target_path
+            elif args.recursive:
+                yield from walk_templates(entry_path,
+                                          os.path.join(output_path, entry) if output_path else None,
+                                          args)
+        elif extension in args.template_extensions and not os.path.isdir(entry_path + ".d"):
+            yield [entry_path], target_entry_path
+
+
+def configure_environment(args):
+    """
+    Apply the arguments that affect how templates are loaded
+    to the shared environment.
+    """
+    # Create the environment here, before any worker threads
+    # could race to do so.
+    environment = get_environment()
+
     # Modify the environment to include a loader if a template
     # base directory was specified.
     if args.template_base_directory is not None:
-        ENVIRONMENT.loader = FileSystemLoader(args.template_base_directory)
+        from jinja2 import FileSystemLoader
 
-    if os.path.isdir(path):
-        if output_path is not None:
-            if not os.path.exists(output_path):
-                os.makedirs(output_path)
-            elif not os.path.isdir(output_path):
-                raise OSError("%s already exists and is not a directory" % (output_path))
-
-        # So we could use os.walk here but we need to control
-        # what we do with directories based on the name so
-        # it's actually easier not to.
-        for entry in os.listdir(path):
-            # Figure out the paths to the current file, the target
-            # file, and the file extension of the current file.
-            entry_path = os.path.realpath(os.path.join(path, entry))
-            entry_name, extension = os.path.splitext(os.path.basename(entry))
-
-            if output_path is not None:
-                target_entry_path = os.path.realpath(os.path.join(output_path, entry_name))
-            else:
-                target_entry_path = None
-
-            # For directories, we either have to descend into them, or
-            # we need to process them as fragments, depending on their
-            # name.
-            if os.path.isdir(entry_path):
-                if extension == '.d' and \
-                   os.path.splitext(entry_name)[1] in args.template_extensions:
-                    if target_entry_path is None:
-                        fragment_target_path = None
-                    else:
-                        fragment_target_path = os.path.splitext(target_entry_path)[0]
-
-                    fragment_base_template = os.path.splitext(entry_path)[0]
-                    if os.path.isfile(fragment_base_template):
-                        render_file(fragment_base_template, context,
-                                    output=fragment_target_path, verbose=args.verbose)
-                    elif fragment_target_path is not None and os.path.isfile(fragment_target_path):
-                        os.unlink(fragment_target_path)
-
-                    for fragment in sorted(os.listdir(entry_path)):
-                        if os.path.splitext(fragment)[1] in args.template_extensions:
-                            fragment_path = os.path.join(entry_path, fragment)
-                            render_file(fragment_path, context,
-                                        output=fragment_target_path,
-                                        verbose=args.verbose, append=True)
-                elif args.recursive:
-                    render(entry_path,
-                           os.path.join(output_path, entry) if output_path else None,
-                           context, args)
-            elif extension in args.template_extensions and not os.path.isdir(entry_path + ".d"):
-                render_file(entry_path, context, output=target_entry_path, verbose=args.verbose)
+        environment.loader = FileSystemLoader(args.template_base_directory)
+
+
+def load_prelude(prelude, context, args):
+    """
+    Render the `prelude` template once against `context` and
+    return the macros and variables it exports, to be added to
+    the context of every other template.
+    """
+    from jinja2.exceptions import TemplateSyntaxError
+
+    configure_environment(args)
+
+    if args.verbose:  # pragma: no cover
+        print("Loading prelude", prelude)
+
+    with open(prelude) as f:
+        try:
+            module = get_environment().from_string(f.read()).make_module(context)
+        except TemplateSyntaxError as e:
+            print(format_syntax_error(prelude, e), file=sys.stderr)
+
+            raise e
+
+    return {k: v for k, v in vars(module).items() if not k.startswith('_')}
+
+
+def render_target(templates, target, context, args):
+    """
+    Render `templates`, in order, into the single `target`.
+    """
+    from contextlib import ExitStack
+
+    # May be missing from `args` built by callers, see `render`.
+    compress = getattr(args, 'compress', [])
+
+    if len(templates) == 0 and target is not None:
+        for stale in [target] + ["%s.%s" % (target, extension) for extension in compress]:
+            if os.path.isfile(stale):
+                os.unlink(stale)
+
+    with ExitStack() as stack:
+        # Compress the whole target as one stream, rather than
+        # appending a member per fragment, which not every
+        # decompressor reads past.
+        if target is not None and len(templates) > 0:
+            compressed = [stack.enter_context(open_compressed(target, extension, 'w'))
+                          for extension in compress]
+        else:
+            compressed = []
+
+        for index, template in enumerate(templates):
+            render_file(template, context, output=target,
+                        verbose=args.verbose, append=index > 0, compressed=compressed)
+
+
+def render(path, output, context, args, prelude=None):
+    """
+    Render a template based on the arguments and
+    the given `raw_context`, which, by default
+    is the OS environment.
+
+    If `args` has a prelude, its exports are added to the
+    context of every template. Pass the result of
+    `load_prelude` as `prelude` to avoid evaluating it again.
+    """
+    configure_environment(args)
+
+    # Callers may build `args` themselves, without the options
+    # added after this function was first made public.
+    if prelude is None and getattr(args, 'prelude', None) is not None:
+        prelude = load_prelude(args.prelude, context, args)
+
+    # The prelude is given explicitly, so its names take
+    # precedence over environment variables of the same name.
+    if prelude is not None:
+        context = dict(context, **prelude)
+
+    # Compression releases the GIL, so compressing several
+    # targets at once in threads keeps it off the critical path.
+    # Output to stdout is never compressed and must stay in order.
+    if len(getattr(args, 'compress', [])) > 0 and output is not None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(render_target, templates, target, context, args)
+                       for templates, target in walk_templates(path, output, args)]
+
+        for future in futures:
+            future.result()
+    else:
+        for templates, target in walk_templates(path, output, args):
+            render_target(templates, target, context, args)
+
+
+def check_file(template):
+    """
+    Parse and compile `template` without rendering it. Returns
+    the formatted error if it is invalid or can't be read,
+    otherwise `None`.
+    """
+    from jinja2.exceptions import TemplateSyntaxError
+
+    try:
+        with open(template) as f:
+            get_environment().compile(f.read(), filename=template)
+    except TemplateSyntaxError as e:
+        return format_syntax_error(template, e, action="checking")
+    except (OSError, UnicodeDecodeError) as e:
+        return "Error checking %s: %s" % (template, e)
+
+    return None
+
+
+def check(path, args, max_workers=None):
+    """
+    Check every template that `render` would process for `path`
+    for syntax errors, compiling them across a pool of
+    processes. All errors are reported and the number of
+    invalid templates is returned.
+    """
+    templates = [template for group, _ in walk_templates(path, None, args) for template in group]
+
+    if args.verbose:  # pragma: no cover
+        for template in templates:
+            print("Checking", template)
+
+    if len(templates) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            errors = list(executor.map(check_file, templates))
     else:
-        render_file(path, context, output=output_path, verbose=args.verbose)
+        errors = [check_file(template) for template in templates]
+
+    errors = [error for error in errors if error is not None]
+
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    return len(errors)
+
+
+def exec_command(command):
+    """
+    Replace the current process with `command`, searching
+    the `PATH` for it and keeping the current environment.
+    """
+    # Anything still buffered would be lost by the exec.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    os.execvp(command[0], command)
 
 
 def parse_arguments(argv):  # pragma: no cover
-    parser = ArgumentParser()
-    parser.add_argument("template", help="Jinja template file or directory to render.")
+    from argparse import ArgumentParser
+
+    command = 'render'
+    if len(argv) > 0 and argv[0] == 'check':
+        command, argv = 'check', argv[1:]
+
+    # Everything after --exec belongs to the command to run, so
+    # split it off before argparse can interpret any of it.
+    exec_argv = None
+    for index, argument in enumerate(argv):
+        if argument == '--exec':
+            argv, exec_argv = argv[:index], argv[index + 1:]
+            if exec_argv[:1] == ['--']:
+                exec_argv = exec_argv[1:]
+            break
+        elif argument.startswith('--exec='):
+            argv, exec_argv = argv[:index], [argument[len('--exec='):]] + argv[index + 1:]
+            break
+
+    parser = ArgumentParser(prog="j2tmpl", epilog="Run `j2tmpl check [OPTIONS] TEMPLATE` to only compile the "
+                                                  "templates and report every syntax error without rendering. "
+                                                  "`check` must be the very first argument, and a template "
+                                                  "named `check` must be given as `./check`.")
+    parser.add_argument("template", nargs="?", help="Jinja template file or directory to render.")
     parser.add_argument("-r", "--recursive", action="store_true",
                         help="Render templates in subdirectories recursively.",
                         default=False)
@@ -295,10 +657,48 @@ def parse_arguments(argv):  # pragma: no cover
                         help="File extensions to interpret as template files (JINJA_TEMPLATE_EXTENSIONS).",  # noqa: E128,E501
                         dest="template_extensions", default=getattr(
                             os.environ, 'JINJA_TEMPLATE_EXTENSIONS', 'tmpl,jinja,jinja2,jnj,j2'))
+    parser.add_argument("--prelude",
+                        help="Template rendered once before all others whose macros and variables "
+                             "are then available to every template.",
+                        dest="prelude", default=None)
+    parser.add_argument("--context-snapshot", "--dump-context",
+                        help="Cache the template context built from the environment in this file "
+                             "and reuse it while the environment does not change.",
+                        dest="context_snapshot", default=None)
+    parser.add_argument("--render", nargs=2, action="append", metavar=("TEMPLATE", "OUTPUT"),
+                        help="Additional template file or directory to render to OUTPUT. "
+                             "May be given multiple times.",
+                        dest="render", default=[])
+    parser.add_argument("--compress",
+                        help="Also write compressed copies of each output file next to it, "
+                             "for each of these comma separated formats (gz, zst).",
+                        dest="compress", default="")
+    parser.add_argument("--exec", metavar="-- COMMAND [ARGS ...]",
+                        help="After rendering, replace this process with COMMAND, keeping the environment. "
+                             "Must be the last option.",
+                        dest="exec_command")
 
     args = parser.parse_args(args=argv)
 
+    if args.template is None and len(args.render) == 0:
+        parser.error("a template or --render is required")
+    # --exec is only registered for the help text. If argparse
+    # filled it, it was abbreviated and missed by the split above.
+    if args.exec_command is not None:
+        parser.error("--exec must be given in full")
+    if exec_argv is not None and (len(exec_argv) == 0 or exec_argv[0] == ''):
+        parser.error("--exec requires a command")
+
+    setattr(args, 'compress', [x for x in args.compress.split(',') if len(x) > 0])
+    for extension in args.compress:
+        if compression_opener(extension) is None:
+            parser.error("%s compression is not supported" % (extension))
+
     setattr(args, 'template_extensions', ["." + x for x in args.template_extensions.split(',')])
+    setattr(args, 'command', command)
+    setattr(args, 'exec_command', exec_argv)
+    setattr(args, 'targets', ([(args.template, args.output)] if args.template is not None else []) +
+            [tuple(target) for target in args.render])
 
     return args
 
@@ -306,13 +706,32 @@ def parse_arguments(argv):  # pragma: no cover
 def main(argv):  # pragma: no cover
     args = parse_arguments(argv)
 
+    if args.command == 'check':
+        sys.exit(1 if sum(check(template, args) for template, _ in args.targets) > 0 else 0)
+
+    from jinja2.exceptions import TemplateSyntaxError
+
     try:
-        render(args.template, args.output, build_template_context(os.environ), args)
+        context = load_template_context(os.environ, args.context_snapshot)
+        prelude = load_prelude(args.prelude, context, args) if args.prelude is not None else None
+
+        for template, output in args.targets:
+            render(template, output, context, args, prelude)
     except TemplateSyntaxError:
         sys.exit(1)
 
+    if args.exec_command is not None:
+        exec_command(args.exec_command)
+
 
 if __name__ == "__main__":  # pragma: no cover
+    # Required for the process pool used by `check` in
+    # the frozen binary.
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+
+        multiprocessing.freeze_support()
+
     if len(sys.argv) > 0:
         main(sys.argv[1:])
     else:
@@ -1,5 +1,7 @@
+import gzip
 import os
 import shutil
+import zlib
 from j2tmpl import cli
 
 try:
@@ -34,16 +36,19 @@ def assert_comparisons(tmpdir, tmpdestdir, comparisons):
             assert src.read() == dest.read()
 
 
-def render_directory(srcdir, dstdir, context, directory, recursive=False):
+def render_directory(srcdir, dstdir, context, directory, recursive=False, compress=False):
     templatedir = os.path.join(TEST_TEMPLATE_PATH, directory, "templates")
     rendereddir = os.path.join(TEST_TEMPLATE_PATH, directory, "rendered")
 
     shutil.copytree(templatedir, srcdir, dirs_exist_ok=True)
 
+    arguments = ['-o', srcdir, dstdir]
     if recursive:
-        args = cli.parse_arguments(['-r', '-o', srcdir, dstdir])
-    else:
-        args = cli.parse_arguments(['-o', srcdir, dstdir])
+        arguments = ['-r'] + arguments
+    if compress:
+        arguments = ['--compress', 'gz'] + arguments
+
+    args = cli.parse_arguments(arguments)
 
     cli.render(srcdir, dstdir,
                cli.build_template_context(context),
@@ -187,3 +192,26 @@ def test_fragment_directory_recursive_inplace(common_environment):
     tmpdir = TemporaryDirectory()
 
     fragment_directory_recursive(tmpdir.name, tmpdir.name, common_environment)
+
+
+def test_fragment_directory_compressed(common_environment):
+    tmpdir = TemporaryDirectory()
+    tmpdestdir = TemporaryDirectory()
+
+    templatedir, rendereddir = render_directory(tmpdir.name, tmpdestdir.name, common_environment,
+                                                "fragment-directory", recursive=True, compress=True)
+
+    for name in ["test.conf", "test2.conf", "nobase.conf", os.path.join("fragment-subdirectory", "sub.conf")]:
+        with open(os.path.join(rendereddir, name)) as src, \
+             open(os.path.join(tmpdestdir.name, name)) as dest, \
+             gzip.open(os.path.join(tmpdestdir.name, name + ".gz"), 'rt') as compressed:
+            expected = src.read()
+            assert dest.read() == expected
+            assert compressed.read() == expected
+
+        # Fragments must not be split across gzip members, as
+        # single member decoders would stop after the first one.
+        with open(os.path.join(tmpdestdir.name, name + ".gz"), 'rb') as f:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            assert decompressor.decompress(f.read()).decode() == expected
+            assert decompressor.unused_data == b''
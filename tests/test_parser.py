@@ -1,4 +1,7 @@
+import os
+
 from j2tmpl import cli
+from tempfile import TemporaryDirectory
 
 import pytest
 
@@ -69,3 +72,80 @@ def test_duplicate_keys_error():
         'oneTwo is defined multiple times' in str(excinfo.value) or
         'ONE_TWO is defined multiple times' in str(excinfo.value)
     )
+
+
+def test_context_snapshot(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "context.snapshot")
+
+    context = cli.load_template_context(common_environment, snapshot)
+
+    assert os.path.isfile(snapshot)
+    assert context == cli.build_template_context(common_environment)
+
+    # A matching environment must come straight from the snapshot.
+    with open(snapshot, 'rb') as f:
+        data = f.read()
+    assert cli.load_template_context(dict(reversed(list(common_environment.items()))), snapshot) == context
+
+    with open(snapshot, 'rb') as f:
+        assert f.read() == data
+
+
+def test_context_snapshot_stale(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "context.snapshot")
+
+    cli.load_template_context(common_environment, snapshot)
+    context = cli.load_template_context(dict(common_environment, EDITOR='nano'), snapshot)
+
+    assert context['editor'] == 'nano'
+    assert cli.load_template_context(dict(common_environment, EDITOR='nano'), snapshot) == context
+
+
+def test_context_snapshot_corrupt(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "context.snapshot")
+
+    with open(snapshot, 'wb') as f:
+        key = cli.snapshot_key(common_environment)
+        f.write(cli.CONTEXT_SNAPSHOT_MAGIC + len(key).to_bytes(4, 'big') + key + b'garbage')
+
+    assert cli.load_template_context(common_environment, snapshot) == \
+        cli.build_template_context(common_environment)
+
+
+def test_context_snapshot_permissions(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "context.snapshot")
+
+    cli.load_template_context(common_environment, snapshot)
+
+    assert os.stat(snapshot).st_mode & 0o777 == 0o600
+
+
+def test_context_snapshot_unwritable(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "missing", "context.snapshot")
+
+    assert cli.load_template_context(common_environment, snapshot) == \
+        cli.build_template_context(common_environment)
+    assert not os.path.exists(os.path.dirname(snapshot))
+
+
+def test_context_snapshot_version(common_environment):
+    tmpdir = TemporaryDirectory()
+    snapshot = os.path.join(tmpdir.name, "context.snapshot")
+
+    cli.load_template_context(common_environment, snapshot)
+    with open(snapshot, 'rb') as f:
+        data = f.read()
+
+    # A snapshot written by another version is never served.
+    with open(snapshot, 'wb') as f:
+        f.write(b'J2TMPLCTX0' + data[len(cli.CONTEXT_SNAPSHOT_MAGIC):])
+
+    assert cli.load_template_context(common_environment, snapshot) == \
+        cli.build_template_context(common_environment)
+    with open(snapshot, 'rb') as f:
+        assert f.read() == data
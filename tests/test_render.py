@@ -1,9 +1,14 @@
+import argparse
+import gc
+import gzip
+import locale
 import os
+import shutil
 import pytest
 
 from jinja2.exceptions import TemplateSyntaxError
 from j2tmpl import cli
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 TEST_TEMPLATE_PATH = os.path.join(os.getcwd(), "tests", "templates")
 
@@ -144,3 +149,209 @@ def test_single_line_error(common_environment, capsys):
     assert "error.jinja" in captured.err
     assert "1: >>" in captured.err
     assert 3 == len(captured.err.split('\n'))
+
+
+def collect_before_fork():
+    # Forked check workers would otherwise finalize temporary files
+    # left unreachable by earlier tests, deleting them from under us.
+    gc.collect()
+
+
+def test_check(capsys):
+    collect_before_fork()
+
+    tmpdir = TemporaryDirectory()
+    for name in ["simple.jinja", "error.jinja", "single-line-error.jinja"]:
+        shutil.copy(os.path.join(TEST_TEMPLATE_PATH, name), tmpdir.name)
+
+    assert 2 == cli.check(tmpdir.name, cli.parse_arguments(['check', tmpdir.name]))
+
+    captured = capsys.readouterr()
+    assert "/error.jinja" in captured.err
+    assert " 9: >>" in captured.err
+    assert "single-line-error.jinja" in captured.err
+    assert "1: >>" in captured.err
+
+
+def test_check_unreadable(capsys):
+    collect_before_fork()
+
+    tmpdir = TemporaryDirectory()
+    for name in ["error.jinja", "single-line-error.jinja"]:
+        shutil.copy(os.path.join(TEST_TEMPLATE_PATH, name), tmpdir.name)
+    os.symlink(os.path.join(tmpdir.name, "missing"), os.path.join(tmpdir.name, "dangling.jinja"))
+
+    assert 3 == cli.check(tmpdir.name, cli.parse_arguments(['check', tmpdir.name]))
+
+    captured = capsys.readouterr()
+    assert "Error checking %s" % os.path.join(os.path.realpath(tmpdir.name), "missing") in captured.err
+    assert "Error checking %s" % os.path.join(os.path.realpath(tmpdir.name), "error.jinja") in captured.err
+    assert "single-line-error.jinja" in captured.err
+    assert "Error rendering" not in captured.err
+
+
+def test_check_undecodable(capsys):
+    if locale.getpreferredencoding(False).lower().replace('-', '') != 'utf8':
+        pytest.skip("only invalid in a UTF-8 locale")
+
+    tmpdir = TemporaryDirectory()
+    templateFile = os.path.join(tmpdir.name, "binary.jinja")
+    with open(templateFile, 'wb') as f:
+        f.write(b'{{ test }}\xff\n')
+
+    assert 1 == cli.check(templateFile, cli.parse_arguments(['check', templateFile]))
+    assert "Error checking %s" % os.path.realpath(templateFile) in capsys.readouterr().err
+
+
+def test_check_valid():
+    collect_before_fork()
+
+    templateDir = os.path.join(TEST_TEMPLATE_PATH, "fragment-directory", "templates")
+
+    assert 0 == cli.check(templateDir, cli.parse_arguments(['check', '-r', templateDir]))
+    assert 0 == cli.check(os.path.join(TEST_TEMPLATE_PATH, "simple.jinja"),
+                          cli.parse_arguments(['check', templateDir]))
+
+
+def test_exec_arguments():
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+    args = cli.parse_arguments(['-o', 'out.conf', templateFile,
+                                '--render', templateFile, 'other.conf',
+                                '--exec', '--', 'nginx', '-g', '--exec'])
+
+    assert args.exec_command == ['nginx', '-g', '--exec']
+    assert args.targets == [(templateFile, 'out.conf'), (templateFile, 'other.conf')]
+    assert cli.parse_arguments([templateFile, '--exec', 'true']).exec_command == ['true']
+    assert cli.parse_arguments([templateFile]).exec_command is None
+
+
+def test_exec_arguments_inline():
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+
+    assert cli.parse_arguments([templateFile, '--exec=nginx', '-g', 'daemon off;']).exec_command == \
+        ['nginx', '-g', 'daemon off;']
+
+    for argv in [[templateFile, '--exe', 'nginx'], [templateFile, '--exec='], [templateFile, '--exec']]:
+        with pytest.raises(SystemExit):
+            cli.parse_arguments(argv)
+
+
+def test_exec_command(monkeypatch):
+    calls = []
+    monkeypatch.setattr(os, 'execvp', lambda file, args: calls.append((file, args)))
+
+    cli.exec_command(['nginx', '-g', 'daemon off;'])
+
+    assert calls == [('nginx', ['nginx', '-g', 'daemon off;'])]
+
+
+def test_compress(common_environment, common_rendered):
+    tmpdir = TemporaryDirectory()
+    outputFile = os.path.join(tmpdir.name, "simple")
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+    cli.render(templateFile, outputFile,
+               cli.build_template_context(common_environment),
+               cli.parse_arguments(['-o', outputFile, '--compress', 'gz', templateFile]))
+
+    with open(outputFile) as output, gzip.open(outputFile + ".gz", 'rt') as compressed:
+        assert output.read().strip() == common_rendered
+        assert compressed.read().strip() == common_rendered
+
+
+def test_compress_zstd(common_environment, common_rendered):
+    zstd = pytest.importorskip("compression.zstd")
+
+    tmpdir = TemporaryDirectory()
+    outputFile = os.path.join(tmpdir.name, "simple")
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+    cli.render(templateFile, outputFile,
+               cli.build_template_context(common_environment),
+               cli.parse_arguments(['-o', outputFile, '--compress', 'gz,zst', templateFile]))
+
+    with zstd.open(outputFile + ".zst", 'rt') as compressed:
+        assert compressed.read().strip() == common_rendered
+
+
+def test_prelude(common_environment):
+    tmpfile = NamedTemporaryFile()
+    preludeFile = os.path.join(TEST_TEMPLATE_PATH, "prelude", "prelude.jinja")
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "prelude", "uses-prelude.jinja")
+    cli.render(templateFile, tmpfile.name,
+               cli.build_template_context(common_environment),
+               cli.parse_arguments(['-o', tmpfile.name, '--prelude', preludeFile, templateFile]))
+
+    output = open(tmpfile.name)
+    assert output.read() == "SHELL=bash\nEDITOR=vim\n"
+    output.close()
+    tmpfile.close()
+
+
+def test_prelude_overrides_environment(common_environment):
+    tmpfile = NamedTemporaryFile()
+    preludeFile = os.path.join(TEST_TEMPLATE_PATH, "prelude", "prelude.jinja")
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "prelude", "uses-prelude.jinja")
+    cli.render(templateFile, tmpfile.name,
+               cli.build_template_context(dict(common_environment, SETTING='1')),
+               cli.parse_arguments(['-o', tmpfile.name, '--prelude', preludeFile, templateFile]))
+
+    output = open(tmpfile.name)
+    assert output.read() == "SHELL=bash\nEDITOR=vim\n"
+    output.close()
+    tmpfile.close()
+
+
+def test_prelude_evaluated_once(common_environment):
+    tmpdir = TemporaryDirectory()
+    preludeFile = os.path.join(TEST_TEMPLATE_PATH, "prelude", "prelude.jinja")
+    for name in ["one.jinja", "two.jinja"]:
+        shutil.copy(os.path.join(TEST_TEMPLATE_PATH, "prelude", "uses-prelude.jinja"),
+                    os.path.join(tmpdir.name, name))
+
+    context = cli.build_template_context(common_environment)
+    args = cli.parse_arguments(['-o', tmpdir.name, '--prelude', preludeFile, tmpdir.name])
+    prelude = cli.load_prelude(preludeFile, context, args)
+    assert set(prelude.keys()) == {'shell_name', 'setting'}
+
+    # Any further evaluation of the prelude would fail.
+    args.prelude = os.path.join(tmpdir.name, "missing.jinja")
+    cli.render(tmpdir.name, tmpdir.name, context, args, prelude)
+
+    for name in ["one", "two"]:
+        with open(os.path.join(tmpdir.name, name)) as output:
+            assert output.read() == "SHELL=bash\nEDITOR=vim\n"
+
+
+def test_compress_unsupported(common_environment, monkeypatch):
+    opened = []
+
+    def tracked_open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(cli, 'open', tracked_open, raising=False)
+
+    tmpdir = TemporaryDirectory()
+    outputFile = os.path.join(tmpdir.name, "simple")
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+
+    with pytest.raises(ValueError):
+        cli.render_file(templateFile, cli.build_template_context(common_environment),
+                        output=outputFile, compress=['bz2'])
+
+    # Both the template and the plain output must have been closed.
+    assert len(opened) == 2
+    assert all(f.closed for f in opened)
+
+
+def test_render_minimal_arguments(common_environment, common_rendered):
+    tmpfile = NamedTemporaryFile()
+    templateFile = os.path.join(TEST_TEMPLATE_PATH, "simple.jinja")
+    args = argparse.Namespace(template_base_directory=None, template_extensions=['.jinja'],
+                              recursive=False, verbose=False)
+
+    cli.render(templateFile, tmpfile.name, cli.build_template_context(common_environment), args)
+
+    output = open(tmpfile.name)
+    assert output.read().strip() == common_rendered
+    output.close()
+    tmpfile.close()
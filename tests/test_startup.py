@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def imported_modules(code):
+    """
+    Run `code` in a fresh interpreter and return the modules
+    it imported.
+    """
+    result = subprocess.run([sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+                            cwd=ROOT, check=True, capture_output=True, text=True)
+
+    return result.stdout.split()
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import j2tmpl.cli")
+
+    assert "jinja2" not in modules
+    assert "argparse" not in modules
+
+
+def test_parse_arguments_is_lazy():
+    modules = imported_modules("from j2tmpl import cli\ncli.parse_arguments(['template.jinja'])")
+
+    assert "jinja2" not in modules
+
+
+def test_environment_is_created_on_use():
+    modules = imported_modules("from j2tmpl import cli\ncli.ENVIRONMENT.from_string('{{ a|boolean }}')")
+
+    assert "jinja2" in modules
+
+
+def test_filters_work_before_environment():
+    result = subprocess.run([sys.executable, "-c",
+                             "from j2tmpl import cli\n"
+                             "print(cli.boolean_filter('yes'), cli.b64decode_filter(cli.b64encode_filter('a')))"],
+                            cwd=ROOT, check=True, capture_output=True, text=True)
+
+    assert result.stdout.strip() == "True a"